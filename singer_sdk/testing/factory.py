@@ -171,7 +171,7 @@ class TapTestClassFactory:
                 self._with_tap_tests(empty_test_class, suite)
 
             if suite.kind in {"tap_stream", "tap_stream_attribute"}:
-                streams = list(test_runner.new_tap().streams.values())
+                streams = list(test_runner.tap.streams.values())
 
                 if suite.kind == "tap_stream":
                     self._with_stream_tests(empty_test_class, suite, streams)
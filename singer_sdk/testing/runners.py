@@ -5,22 +5,123 @@ from __future__ import annotations
 import abc
 import io
 import json
+import os
+import sys
 import typing as t
 from collections import defaultdict
-from contextlib import redirect_stderr, redirect_stdout
+from contextlib import contextmanager
+from pathlib import Path
 
-from singer_sdk import Tap, Target
 from singer_sdk.testing.config import SuiteConfig
 
 if t.TYPE_CHECKING:
-    from pathlib import Path
-
+    from singer_sdk import Tap, Target
     from singer_sdk.helpers._compat import Traversable
 
+# Read Singer input files in large chunks to keep the number of read calls low.
+_INPUT_BUFFER_SIZE = 1024 * 1024
+# Number of characters of tap output collected before it is parsed.
+_WRITE_BATCH_SIZE = 64 * 1024
+
+_raw_decode = json.JSONDecoder().raw_decode
+
+
+def iter_singer_messages(lines: t.Iterable[str]) -> t.Iterator[dict]:
+    """Parse Singer messages from an iterable of JSON lines, skipping blank lines.
+
+    Args:
+        lines: Lines of JSON, e.g. an open Singer file.
+
+    Yields:
+        Each message in dict form.
+    """
+    for line in lines:
+        if line and not line.isspace():
+            # raw_decode skips the whitespace handling of json.loads. Lines it does
+            # not consume whole, e.g. padded or invalid ones, go through json.loads,
+            # which parses or rejects them as usual.
+            try:
+                message, end = _raw_decode(line)
+            except ValueError:
+                end = 0
+            if end != len(line):
+                message = json.loads(line)
+            yield message
+
+
+class _LineDispatchingWriter(io.TextIOBase):
+    """Text stream that parses the Singer messages written to it in batches.
+
+    It stands in for the tap's STDOUT, so it has to be a text stream. Singer writers
+    flush after every message, which is a no-op here: written text is only parsed
+    once at least `_WRITE_BATCH_SIZE` characters of it have built up. Messages are
+    thus decoded in bulk, while only one batch is ever held in memory.
+    """
+
+    def __init__(self, dispatch: t.Callable[[list[dict]], None]) -> None:
+        """Initialize the writer.
+
+        Args:
+            dispatch: Callback receiving each batch of parsed messages.
+        """
+        super().__init__()
+        self._dispatch = dispatch
+        self._chunks: list[str] = []
+        self._size = 0
+
+    def writable(self) -> bool:
+        """Whether the stream supports writing.
+
+        Returns:
+            Always True.
+        """
+        return True
+
+    def write(self, s: str) -> int:
+        """Buffer a string, parsing the complete lines once a batch has built up.
+
+        Args:
+            s: The string to write.
+
+        Returns:
+            The number of characters written.
+        """
+        self._chunks.append(s)
+        self._size += len(s)
+        if self._size >= _WRITE_BATCH_SIZE and "\n" in s:
+            text = "".join(self._chunks)
+            end = text.rfind("\n") + 1
+            self._chunks = [text[end:]]
+            self._size = len(text) - end
+            self._dispatch_block(text[:end])
+        return len(s)
+
+    def close(self) -> None:
+        """Parse any remaining output and close the stream."""
+        if not self.closed:
+            text = "".join(self._chunks)
+            self._chunks.clear()
+            self._size = 0
+            self._dispatch_block(text)
+        super().close()
+
+    def _dispatch_block(self, block: str) -> None:
+        messages = list(iter_singer_messages(block.split("\n")))
+        if messages:
+            self._dispatch(messages)
+
 
 class SingerTestRunner(metaclass=abc.ABCMeta):
     """Base Singer Test Runner."""
 
+    __slots__ = (
+        "config",
+        "default_kwargs",
+        "raw_messages",
+        "singer_class",
+        "suite_config",
+    )
+
     def __init__(
         self,
         singer_class: type[Tap] | type[Target],
@@ -41,12 +142,11 @@ class SingerTestRunner(metaclass=abc.ABCMeta):
         self.config = config or {}
         self.default_kwargs = kwargs
         self.suite_config = suite_config or SuiteConfig()
+        self._clear_messages()
 
+    def _clear_messages(self) -> None:
+        """Give the runner a fresh, empty list of raw messages."""
         self.raw_messages: list[dict] = []
-        self.schema_messages: list[dict] = []
-        self.record_messages: list[dict] = []
-        self.state_messages: list[dict] = []
-        self.records: defaultdict = defaultdict(list)
 
     @staticmethod
     def _clean_sync_output(raw_records: str) -> list[dict]:
@@ -58,8 +158,36 @@ class SingerTestRunner(metaclass=abc.ABCMeta):
         Returns:
             A list of raw messages in dict form.
         """
-        lines = raw_records.strip().split("\n")
-        return [json.loads(ii) for ii in lines if ii]
+        return list(iter_singer_messages(raw_records.split("\n")))
+
+    @staticmethod
+    @contextmanager
+    def capture(
+        stdout: t.IO[str],
+        stderr: t.IO[str] | None = None,
+    ) -> t.Iterator[None]:
+        """Send STDOUT, and optionally STDERR, to the given streams within the block.
+
+        The same streams can be passed to several captures, for example to collect
+        the output of multiple syncs in a single buffer.
+
+        Args:
+            stdout: Stream to write STDOUT to.
+            stderr: Stream to write STDERR to. STDERR is left as is if not given.
+
+        Yields:
+            None.
+        """
+        prev_stdout, prev_stderr = sys.stdout, sys.stderr
+        sys.stdout = stdout
+        if stderr is not None:
+            sys.stderr = stderr
+        try:
+            yield
+        finally:
+            sys.stdout = prev_stdout
+            if stderr is not None:
+                sys.stderr = prev_stderr
 
     def create(self, kwargs: dict | None = None) -> Tap | Target:
         """Create a new tap/target from the runner defaults.
@@ -86,11 +214,28 @@ class SingerTestRunner(metaclass=abc.ABCMeta):
 class TapTestRunner(SingerTestRunner):
     """Utility class to simplify tap testing."""
 
+    __slots__ = (
+        "_record_messages",
+        "_records",
+        "_schema_messages",
+        "_state_messages",
+        "_tap",
+        "capture_stderr",
+        "stderr",
+    )
+
+    _schema_messages: list[dict] | None
+    _record_messages: list[dict] | None
+    _state_messages: list[dict] | None
+    _records: defaultdict | None
+
     def __init__(
         self,
         tap_class: type[Tap],
         config: dict | None = None,
         suite_config: SuiteConfig | None = None,
+        *,
+        capture_stderr: bool = False,
         **kwargs: t.Any,
     ) -> None:
         """Initialize Tap instance.
@@ -100,6 +245,8 @@ class TapTestRunner(SingerTestRunner):
             config: Config dict to pass to Tap class.
             suite_config (SuiteConfig): SuiteConfig instance to be used when
                 instantiating tests.
+            capture_stderr: Whether to capture the tap's STDERR output (e.g. logs)
+                during syncs into `stderr` instead of letting it through.
             kwargs: Default arguments to be passed to tap on create.
         """
         super().__init__(
@@ -108,6 +255,24 @@ class TapTestRunner(SingerTestRunner):
             suite_config=suite_config,
             **kwargs,
         )
+        self.capture_stderr = capture_stderr
+        self.stderr: str | None = None
+        self._tap: Tap | None = None
+
+    @property
+    def tap(self) -> Tap:
+        """Tap instance shared by runner operations that do not sync.
+
+        The instance is created on first access and reused afterwards. Syncs and
+        connection tests run on instances from `new_tap` instead, so this one is
+        never mutated by them.
+
+        Returns:
+            A configured Tap instance.
+        """
+        if self._tap is None:
+            self._tap = self.new_tap()
+        return self._tap
 
     def new_tap(self) -> Tap:
         """Get new Tap instance.
@@ -115,7 +280,7 @@ class TapTestRunner(SingerTestRunner):
         Returns:
             A configured Tap instance.
         """
-        return t.cast(Tap, self.create())
+        return self.create()  # type: ignore[return-value]
 
     def run_discovery(self) -> str:
         """Run tap discovery.
@@ -123,7 +288,7 @@ class TapTestRunner(SingerTestRunner):
         Returns:
             The catalog as a string.
         """
-        return self.new_tap().run_discovery()
+        return self.tap.run_discovery()
 
     def run_connection_test(self) -> bool:
         """Run tap connection test.
@@ -147,55 +312,151 @@ class TapTestRunner(SingerTestRunner):
 
         return new_tap.run_sync_dry_run(dry_run_record_limit=dry_run_record_limit)
 
+    @property
+    def schema_messages(self) -> list[dict]:
+        """SCHEMA messages emitted by the tap, collected on first access.
+
+        Returns:
+            A list of SCHEMA messages in dict form.
+        """
+        if self._schema_messages is None:
+            self._schema_messages = self._messages_of_type("SCHEMA")
+        return self._schema_messages
+
+    @schema_messages.setter
+    def schema_messages(self, value: list[dict]) -> None:
+        self._schema_messages = value
+
+    @property
+    def record_messages(self) -> list[dict]:
+        """RECORD messages emitted by the tap, collected on first access.
+
+        Returns:
+            A list of RECORD messages in dict form.
+        """
+        if self._record_messages is None:
+            self._record_messages = self._messages_of_type("RECORD")
+        return self._record_messages
+
+    @record_messages.setter
+    def record_messages(self, value: list[dict]) -> None:
+        self._record_messages = value
+
+    @property
+    def state_messages(self) -> list[dict]:
+        """STATE messages emitted by the tap, collected on first access.
+
+        Returns:
+            A list of STATE messages in dict form.
+        """
+        if self._state_messages is None:
+            self._state_messages = self._messages_of_type("STATE")
+        return self._state_messages
+
+    @state_messages.setter
+    def state_messages(self, value: list[dict]) -> None:
+        self._state_messages = value
+
+    @property
+    def records(self) -> defaultdict:
+        """Records emitted by the tap grouped by stream, collected on first access.
+
+        Streams that sent a SCHEMA message but no records map to an empty list.
+
+        Returns:
+            A mapping of stream names to lists of records.
+        """
+        if self._records is None:
+            records: defaultdict = defaultdict(list)
+            for message in self.raw_messages:
+                message_type = message.get("type")
+                if message_type == "RECORD":
+                    records[message["stream"]].append(message["record"])
+                elif message_type == "SCHEMA":
+                    records.setdefault(message["stream"], [])
+            self._records = records
+        return self._records
+
+    @records.setter
+    def records(self, value: defaultdict) -> None:
+        self._records = value
+
     def sync_all(self, **kwargs: t.Any) -> None:  # noqa: ARG002
         """Run a full tap sync, assigning output to the runner object.
 
+        Messages captured by a previous sync are discarded.
+
         Args:
             kwargs: Unused keyword arguments.
         """
-        stdout, stderr = self._execute_sync()
-        messages = self._clean_sync_output(stdout)
-        self._parse_records(messages)
+        self._clear_messages()
+        self.stderr = self._execute_sync()
+
+    def _clear_messages(self) -> None:
+        """Give the runner an empty list of raw messages to collect a sync into."""
+        super()._clear_messages()
+        self._clear_parsed_messages()
+
+    def _clear_parsed_messages(self) -> None:
+        """Drop the collections derived from the raw messages so they are rebuilt."""
+        self._schema_messages = None
+        self._record_messages = None
+        self._state_messages = None
+        self._records = None
+
+    def _messages_of_type(self, message_type: str) -> list[dict]:
+        """Get the raw messages of the given type.
+
+        Args:
+            message_type: A Singer message type, e.g. "RECORD".
+
+        Returns:
+            A list of messages in dict form.
+        """
+        return [m for m in self.raw_messages if m.get("type") == message_type]
 
     def _parse_records(self, messages: list[dict]) -> None:
-        """Save raw and parsed messages onto the runner object.
+        """Save raw messages onto the runner object.
+
+        Schema, record and state messages are only sorted out of the raw messages
+        when first accessed after a sync, so a test reading one of them does not pay
+        for the others.
 
         Args:
             messages: A list of messages in dict form.
         """
-        self.raw_messages = messages
-        for message in messages:
-            if message:
-                if message["type"] == "STATE":
-                    self.state_messages.append(message)
-                    continue
-                if message["type"] == "SCHEMA":
-                    self.schema_messages.append(message)
-                    continue
-                if message["type"] == "RECORD":
-                    stream_name = message["stream"]
-                    self.record_messages.append(message)
-                    self.records[stream_name].append(message["record"])
-                    continue
-
-    def _execute_sync(self) -> tuple[str, str]:
-        """Invoke a Tap object and return STDOUT and STDERR results in StringIO buffers.
+        self.raw_messages.extend(messages)
+
+    def _execute_sync(self) -> str | None:
+        """Invoke a Tap object, parsing its STDOUT messages while it runs.
 
         Returns:
-            A 2-item tuple with StringIO buffers from the Tap's output: (stdout, stderr)
+            The Tap's STDERR output, or None if `capture_stderr` is off.
         """
-        stdout_buf = io.StringIO()
-        stderr_buf = io.StringIO()
-        with redirect_stdout(stdout_buf), redirect_stderr(stderr_buf):
+        stdout_writer = _LineDispatchingWriter(self._parse_records)
+        stderr_buf = io.StringIO() if self.capture_stderr else None
+        with self.capture(stdout_writer, stderr_buf):  # type: ignore[arg-type]
             self.run_sync_dry_run()
-        stdout_buf.seek(0)
-        stderr_buf.seek(0)
-        return stdout_buf.read(), stderr_buf.read()
+        stdout_writer.close()
+
+        return None if stderr_buf is None else stderr_buf.getvalue()
 
 
 class TargetTestRunner(SingerTestRunner):
     """Utility class to simplify target testing."""
 
+    __slots__ = (
+        "_input",
+        "input_filepath",
+        "input_io",
+        "record_messages",
+        "records",
+        "schema_messages",
+        "state_messages",
+        "stderr",
+        "stdout",
+    )
+
     def __init__(
         self,
         target_class: type[Target],
@@ -227,13 +488,21 @@ class TargetTestRunner(SingerTestRunner):
         self.input_io = input_io
         self._input: t.IO[str] | None = None
 
+    def _clear_messages(self) -> None:
+        """Give the runner fresh, empty message collections."""
+        super()._clear_messages()
+        self.schema_messages: list[dict] = []
+        self.record_messages: list[dict] = []
+        self.state_messages: list[dict] = []
+        self.records: defaultdict = defaultdict(list)
+
     def new_target(self) -> Target:
         """Get new Target instance.
 
         Returns:
             A configured Target instance.
         """
-        return t.cast(Target, self.create())
+        return self.create()  # type: ignore[return-value]
 
     @property
     def target_input(self) -> t.IO[str]:
@@ -245,9 +514,15 @@ class TargetTestRunner(SingerTestRunner):
         if self._input is None:
             if self.input_io:
                 self._input = self.input_io
+            elif isinstance(self.input_filepath, os.PathLike):
+                self._input = Path(self.input_filepath).open(  # noqa: SIM115
+                    encoding="utf8",
+                    newline="",
+                    buffering=_INPUT_BUFFER_SIZE,
+                )
             elif self.input_filepath:
                 self._input = self.input_filepath.open(encoding="utf8")
-        return t.cast(t.IO[str], self._input)
+        return self._input  # type: ignore[return-value]
 
     @target_input.setter
     def target_input(self, value: t.IO[str]) -> None:
@@ -267,12 +542,11 @@ class TargetTestRunner(SingerTestRunner):
             kwargs: Unused keyword arguments.
         """
         target = self.new_target()
-        stdout, stderr = self._execute_sync(
+        self.stdout, self.stderr = self._execute_sync(
             target=target,
             target_input=self.target_input,
             finalize=finalize,
         )
-        self.stdout, self.stderr = (stdout.read(), stderr.read())
         self.state_messages.extend(self._clean_sync_output(self.stdout))
 
     def _execute_sync(
@@ -281,7 +555,7 @@ class TargetTestRunner(SingerTestRunner):
         target_input: t.IO[str],
         *,
         finalize: bool = True,
-    ) -> tuple[io.StringIO, io.StringIO]:
+    ) -> tuple[str, str]:
         """Invoke the target with the provided input.
 
         Args:
@@ -291,18 +565,15 @@ class TargetTestRunner(SingerTestRunner):
                 False to keep the sink operation open for further records.
 
         Returns:
-            A 2-item tuple with StringIO buffers from the Target's output:
-                (stdout, stderr)
+            A 2-item tuple with the Target's output: (stdout, stderr)
         """
         stdout_buf = io.StringIO()
         stderr_buf = io.StringIO()
 
-        with redirect_stdout(stdout_buf), redirect_stderr(stderr_buf):
+        with self.capture(stdout_buf, stderr_buf):
             if target_input is not None:
                 target._process_lines(target_input)  # noqa: SLF001
             if finalize:
                 target._process_endofpipe()  # noqa: SLF001
 
-        stdout_buf.seek(0)
-        stderr_buf.seek(0)
-        return stdout_buf, stderr_buf
+        return stdout_buf.getvalue(), stderr_buf.getvalue()
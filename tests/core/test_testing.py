@@ -2,9 +2,42 @@
 
 from __future__ import annotations
 
+import io
+import math
+import sys
+import typing as t
+
 import pytest
 
+from singer_sdk import Stream, Tap
 from singer_sdk.testing.factory import BaseTestClass
+from singer_sdk.testing.runners import (
+    SingerTestRunner,
+    TapTestRunner,
+    _LineDispatchingWriter,
+    iter_singer_messages,
+)
+
+
+class LoggingStream(Stream):
+    """Stream that logs a line while syncing."""
+
+    name = "logging"
+    schema = {"properties": {"id": {"type": "integer"}}}  # noqa: RUF012
+
+    def get_records(self, context: dict | None) -> t.Iterable[dict]:  # noqa: ARG002
+        self.logger.info("Syncing the logging stream")
+        yield {"id": 1}
+
+
+class LoggingTap(Tap):
+    """Tap with a single logging stream."""
+
+    name = "logging-tap"
+    config_jsonschema = {"properties": {}}  # noqa: RUF012
+
+    def discover_streams(self) -> list[Stream]:
+        return [LoggingStream(self)]
 
 
 def test_module_deprecations():
@@ -41,3 +74,158 @@ def test_test_class_mro():
     assert PluginTestClass.params == {"x": 1}
     assert AnotherPluginTestClass.params == {"x": 2, "y": 3}
     assert SubPluginTestClass.params == {"x": 1}
+
+
+def test_line_dispatching_writer(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("singer_sdk.testing.runners._WRITE_BATCH_SIZE", 40)
+    batches = []
+    writer = _LineDispatchingWriter(batches.append)
+
+    # Nothing is parsed until a batch has built up, flushing included
+    writer.write('{"type": "SCHEMA", "stream": "s"}\n')
+    writer.flush()
+    assert batches == []
+
+    writer.write('{"type": "REC')
+    writer.write('ORD", "stream": "s", "record": {"id": "é"}}\n\n{"type": ')
+    assert batches == [
+        [
+            {"type": "SCHEMA", "stream": "s"},
+            {"type": "RECORD", "stream": "s", "record": {"id": "é"}},
+        ],
+    ]
+
+    writer.write('"STATE", "value": {}}')
+    writer.close()
+    assert batches[1:] == [[{"type": "STATE", "value": {}}]]
+
+
+def test_iter_singer_messages():
+    lines = io.StringIO(
+        '{"type": "STATE", "value": {"a": 1}}\n\n  \n{"type": "STATE"}\n'
+    )
+    assert list(iter_singer_messages(lines)) == [
+        {"type": "STATE", "value": {"a": 1}},
+        {"type": "STATE"},
+    ]
+
+
+def test_tap_runner_reuses_tap():
+    runner = TapTestRunner(LoggingTap, parse_env_config=False)
+    tap = runner.tap
+    assert runner.tap is tap
+    assert runner.new_tap() is not tap
+
+    runner.sync_all()
+    assert runner.tap is tap
+    assert tap.state == {}
+
+
+@pytest.mark.parametrize("capture_stderr", [True, False])
+def test_tap_runner_capture_stderr(capture_stderr: bool):
+    runner = TapTestRunner(
+        LoggingTap,
+        parse_env_config=False,
+        capture_stderr=capture_stderr,
+    )
+    runner.sync_all()
+
+    assert runner.records["logging"] == [{"id": 1}]
+    if capture_stderr:
+        assert "Syncing the logging stream" in runner.stderr
+    else:
+        assert runner.stderr is None
+
+
+@pytest.mark.parametrize(
+    "block",
+    [
+        '{"type": "STATE", "value": {}}\n{"type": "STATE", "value": {"a": 1}}\n',
+        '\n{"type": "STATE", "value": {}}\n\n  \n{"type": "STATE", "value": {"a": 1}}',
+        ' {"type": "STATE", "value": {}}\r\n{"type": "STATE", "value": {"a": 1}}  ',
+    ],
+    ids=["contiguous", "blank_lines", "padded_lines"],
+)
+def test_clean_sync_output(block: str):
+    assert SingerTestRunner._clean_sync_output(block) == [
+        {"type": "STATE", "value": {}},
+        {"type": "STATE", "value": {"a": 1}},
+    ]
+
+
+def test_clean_sync_output_special_numbers():
+    block = (
+        '{"type": "RECORD", "stream": "s", "record": {"n": NaN}}\n'
+        '{"type": "RECORD", "stream": "s", "record": {"n": 123456789012345678901234567890}}\n'  # noqa: E501
+    )
+    first, second = SingerTestRunner._clean_sync_output(block)
+    assert math.isnan(first["record"]["n"])
+    assert second["record"]["n"] == 123456789012345678901234567890
+
+
+@pytest.mark.parametrize(
+    "block",
+    [
+        '{"type": "STATE", "value": {}},{"type": "STATE", "value": {"a": 1}}\n',
+        '{"type": "STATE", "value": {}}\n1, 2\n',
+        "[1\n2]\n3,4",
+    ],
+    ids=["comma_joined_messages", "comma_joined_values", "value_across_lines"],
+)
+def test_clean_sync_output_rejects_invalid_lines(block: str):
+    with pytest.raises(ValueError):  # noqa: PT011
+        SingerTestRunner._clean_sync_output(block)
+
+
+def test_tap_runner_parse_records(tap_class):
+    runner = TapTestRunner(
+        tap_class,
+        config={"username": "utest", "password": "ptest"},
+        parse_env_config=False,
+    )
+    runner._parse_records(
+        [
+            {"type": "SCHEMA", "stream": "empty", "schema": {}},
+            {"type": "SCHEMA", "stream": "test", "schema": {}},
+            {"type": "RECORD", "stream": "test", "record": {"id": 1}},
+            {"type": "STATE", "value": {}},
+        ],
+    )
+    runner._parse_records([{"type": "RECORD", "stream": "test", "record": {"id": 2}}])
+
+    assert len(runner.raw_messages) == 5
+    assert len(runner.schema_messages) == 2
+    assert len(runner.record_messages) == 2
+    assert len(runner.state_messages) == 1
+    assert runner.records == {"empty": [], "test": [{"id": 1}, {"id": 2}]}
+
+    # Collections are rebuilt from the messages of the next sync
+    runner._clear_messages()
+    runner._parse_records([{"type": "RECORD", "stream": "other", "record": {}}])
+    assert runner.schema_messages == []
+    assert runner.records == {"other": [{}]}
+
+
+def test_runner_capture():
+    stdout, stderr = sys.stdout, sys.stderr
+    sink = io.StringIO()
+
+    with SingerTestRunner.capture(sink):
+        print("first")  # noqa: T201
+        assert sys.stderr is stderr
+    with SingerTestRunner.capture(sink, sink):
+        print("second")  # noqa: T201
+        print("third", file=sys.stderr)  # noqa: T201
+
+    assert sys.stdout is stdout
+    assert sys.stderr is stderr
+    assert sink.getvalue() == "first\nsecond\nthird\n"
+
+    # STDERR is only restored if it was captured
+    other = io.StringIO()
+    try:
+        with SingerTestRunner.capture(sink):
+            sys.stderr = other
+        assert sys.stderr is other
+    finally:
+        sys.stderr = stderr